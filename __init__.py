@@ -18,12 +18,32 @@
 # 02110-1301, USA.
 
 
+import cProfile
+from functools import wraps
+import os
+import pstats
 import re
+import tracemalloc
+import types
+import weakref
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+from PyQt6 import (
+    QtCore,
+    QtWidgets,
+)
 
 from picard.plugin3.api import (
+    Album,
+    BaseAction,
     Metadata,
     OptionsPage,
     PluginApi,
+    Track,
     t_,
 )
 
@@ -36,6 +56,12 @@ performers_split = re.compile(r", | and ").split
 
 WORD_LIST = ['guest', 'solo', 'additional']
 
+KEYWORD_PACKS_DIR = 'keywords'
+
+PROFILE_ENV_VAR = 'PICARD_FORMAT_PERFORMER_TAGS_PROFILE_EVERY_N_CALLS'
+PROFILE_DIR = 'profile'
+PROFILE_TOP_ALLOCATIONS = 25
+
 
 class ManifestTranslations:
     NAME = t_("manifest.name", "Format Performer Tags")
@@ -49,9 +75,90 @@ class ManifestTranslations:
     )
 
 
+class KeywordMatcher:
+    """Token trie matching the keyword phrases of all enabled packs in a single pass.
+
+    The cost of matching an instrument depends on its number of words and the
+    length of the longest phrase, not on the number of phrases or packs.
+    """
+
+    def __init__(self, phrases):
+        self.trie = {}
+        for phrase, keyword in phrases.items():
+            node = self.trie
+            for word in phrase.split():
+                node = node.setdefault(word, {})
+            node[None] = keyword
+
+    def split(self, words):
+        """Split the words into the remaining words and a list of (keyword, phrase) matches,
+        using the longest phrase starting at each word."""
+        remaining = []
+        matches = []
+        i = 0
+        count = len(words)
+        while i < count:
+            node = self.trie
+            match = None
+            j = i
+            while j < count:
+                node = node.get(words[j])
+                if node is None:
+                    break
+                j += 1
+                if None in node:
+                    match = (node[None], j)
+            if match is None:
+                remaining.append(words[i])
+                i += 1
+            else:
+                keyword, j = match
+                matches.append((keyword, ' '.join(words[i:j])))
+                i = j
+        return remaining, matches
+
+
+class TrackCredits:
+    """Cached credits of a track, with the track metadata they were applied to.
+
+    Each credit is a tuple of (key, values, main key, parsed instruments), holding only
+    strings and tuples so that the cache adds no work for the garbage collector.
+    """
+
+    __slots__ = ('metadata', 'credits')
+
+    def __init__(self, metadata, credits):
+        self.metadata = metadata
+        self.credits = credits
+
+
 class FormatPerformerTags:
     def __init__(self, api: PluginApi):
         self.api = api
+        # Cached credits by album (or track) passed to the processor and by track node id
+        self.track_credits = weakref.WeakKeyDictionary()
+        self.keyword_packs = load_keyword_packs(api)
+        self.enabled_packs = None
+        self.keyword_matcher = None
+        self.set_keyword_packs(api.plugin_config["keyword_packs"])
+
+    def set_keyword_packs(self, enabled_packs):
+        if enabled_packs == self.enabled_packs:
+            return
+        phrases = {}
+        for pack_id in enabled_packs:
+            if pack_id not in self.keyword_packs:
+                self.api.logger.warning("%s: Keyword pack not found: '%s'", "Format Performer Tags", pack_id,)
+                continue
+            for phrase, keyword in self.keyword_packs[pack_id][1].items():
+                if phrases.get(phrase, keyword) != keyword:
+                    self.api.logger.warning(
+                        "%s: Phrase '%s' of keyword '%s' is reassigned to keyword '%s' by keyword pack '%s'",
+                        "Format Performer Tags", phrase, phrases[phrase], keyword, pack_id,
+                    )
+                phrases[phrase] = keyword
+        self.enabled_packs = list(enabled_packs)
+        self.keyword_matcher = KeywordMatcher(phrases)
 
     def get_word_dict(self, settings):
         word_dict = {}
@@ -59,30 +166,44 @@ class FormatPerformerTags:
             word_dict[word] = settings["format_group_" + word]
         return word_dict
 
-    def rewrite_tag(self, key, values, metadata, word_dict, settings):
+    def parse_tag(self, key, values):
+        """Split a performer key into its main key and a tuple of parsed instruments, each
+        a tuple of (keywords, instrument key, vocals), or None for an empty instrument."""
         if ':' not in key:
             mainkey = key
             subkey = ''
         else:
             mainkey, subkey = key.split(':', 1)
-        self.api.logger.debug("%s: Removing key: '%s'", "Format Performer Tags", key,)
-        metadata.delete(key)
         self.api.logger.debug("%s: Formatting Performer [%s: %s]", "Format Performer Tags", subkey, values,)
-        if not subkey:
-            instruments = []
-        else:
-            instruments = performers_split(subkey)
-        if instruments:
-            for instrument in instruments:
-                groups = {1: [], 2: [], 3: [], 4: [],}
+        instruments = []
+        if subkey:
+            for instrument in performers_split(subkey):
+                if not instrument:
+                    instruments.append(None)
+                    continue
                 vocals = ''
-                if instrument:
+                words, keywords = self.keyword_matcher.split(instrument.split())
+                if words:
+                    instrument_key = ' '.join(words)
+                    if (len(words) > 1) and (words[-1] in ["vocal", "vocals",]):
+                        vocals = " ".join(words[:-1])
+                        instrument_key = words[-1]
+                else:
                     instrument_key = ''
-                    words = instrument.split()
-                    for word in words[:]:
-                        if word in WORD_LIST:
-                            groups[word_dict[word]].append(word)
-                            words.remove(word)
+                instruments.append((tuple(keywords), instrument_key, vocals))
+        return mainkey, tuple(instruments)
+
+    def render_tag(self, mainkey, instruments, values, word_dict, settings):
+        """Format parsed instruments, returning the list of (key, value) pairs to add."""
+        output = []
+        if instruments:
+            for parsed in instruments:
+                groups = {1: [], 2: [], 3: [], 4: [],}
+                # An empty instrument reuses the display groups and instrument key of the previous one
+                if parsed is not None:
+                    keywords, instrument_key, vocals = parsed
+                    for keyword, phrase in keywords:
+                        groups[word_dict[keyword]].append(phrase)
                     display_group = {}
                     for group_number in range(1, 5):
                         if groups[group_number]:
@@ -94,13 +215,6 @@ class FormatPerformerTags:
                                 + settings["format_group_{0}_end_char".format(group_number)]
                         else:
                             display_group[group_number] = ""
-                    if words:
-                        instrument_key = ' '.join(words)
-                        if (len(words) > 1) and (words[-1] in ["vocal", "vocals",]):
-                            vocals = " ".join(words[:-1])
-                            instrument_key = words[-1]
-                    else:
-                        instrument_key = ''
                     if vocals:
                         group_number = settings["format_group_vocals"]
                         temp_group = groups[group_number][:]
@@ -117,19 +231,348 @@ class FormatPerformerTags:
                 newkey = ('%s:%s%s%s%s' % (mainkey, display_group[1], instrument_key, display_group[2], display_group[3],))
                 self.api.logger.debug("%s: newkey: %s", "Format Performer Tags", newkey,)
                 for value in values:
-                    metadata.add_unique(newkey, (value + display_group[4]))
+                    output.append((newkey, value + display_group[4]))
         else:
             newkey = '%s:' % (mainkey,)
             self.api.logger.debug("%s: newkey: %s", "Format Performer Tags", newkey,)
             for value in values:
+                output.append((newkey, value))
+        return output
+
+    def rewrite_tag(self, key, values, metadata, word_dict, settings):
+        self.api.logger.debug("%s: Removing key: '%s'", "Format Performer Tags", key,)
+        metadata.delete(key)
+        mainkey, instruments = self.parse_tag(key, values)
+        for newkey, value in self.render_tag(mainkey, instruments, values, word_dict, settings):
+            metadata.add_unique(newkey, value)
+        return mainkey, instruments
+
+    @staticmethod
+    def get_depends(instruments, word_dict, settings):
+        """Return the options used to format the parsed instruments: the keyword and vocals
+        group assignments, and the characters of the groups they are assigned to."""
+        depends = set()
+        group_numbers = set()
+        for parsed in instruments:
+            if parsed is None:
+                continue
+            keywords, instrument_key, vocals = parsed
+            for keyword, phrase in keywords:
+                depends.add("format_group_" + keyword)
+                group_numbers.add(word_dict[keyword])
+            if vocals:
+                depends.add("format_group_vocals")
+                group_numbers.add(settings["format_group_vocals"])
+        for group_number in group_numbers:
+            depends.add("format_group_{0}_start_char".format(group_number))
+            depends.add("format_group_{0}_sep_char".format(group_number))
+            depends.add("format_group_{0}_end_char".format(group_number))
+        return frozenset(depends)
+
+    @staticmethod
+    def replay_credits(credits, outputs):
+        """Rebuild the performer tags of a track from its cached credits and their formatted outputs."""
+        metadata = Metadata()
+        for key, values, mainkey, instruments in credits:
+            metadata[key] = values
+        for (key, values, mainkey, instruments), output in zip(credits, outputs):
+            metadata.delete(key)
+            for newkey, value in output:
                 metadata.add_unique(newkey, value)
+        return metadata
+
+    def render_credits(self, credits, settings):
+        word_dict = self.get_word_dict(settings)
+        return [self.render_tag(mainkey, instruments, values, word_dict, settings) for key, values, mainkey, instruments in credits]
+
+    @staticmethod
+    def find_track(album, metadata):
+        """Return the loaded track whose metadata is `metadata`, if any."""
+        tracks = album.tracks if isinstance(album, Album) else [album]
+        for track in tracks:
+            if track.metadata is metadata:
+                return track
+        return None
 
     def format_performer_tags(self, api, album, metadata, *args):
-        word_dict = self.get_word_dict(self.api.plugin_config)
+        settings = self.api.plugin_config
+        word_dict = self.get_word_dict(settings)
+        track_node = args[0] if args else None
+        node_id = track_node.get('id') if track_node else None
+        credits = []
         for key, values in list(
             filter(lambda filter_tuple: filter_tuple[0].startswith('performer') or filter_tuple[0].startswith('~performersort'), metadata.rawitems())
         ):
-            self.rewrite_tag(key, values, metadata, word_dict, self.api.plugin_config)
+            mainkey, instruments = self.rewrite_tag(key, values, metadata, word_dict, settings)
+            credits.append((key, tuple(values), mainkey, instruments))
+        if not credits or album is None or node_id is None:
+            return
+        if album not in self.track_credits:
+            self.track_credits[album] = {}
+        self.track_credits[album][node_id] = TrackCredits(metadata, tuple(credits))
+
+    def reformat_loaded_tracks(self, changed_options, previous_settings):
+        """Re-render only the cached credits depending on the changed options, and reapply
+        the results to the loaded tracks whose performer tags actually changed.
+
+        `previous_settings` holds the option values the loaded tracks were formatted with.
+        """
+        if not self.track_credits:
+            return
+        reparse = "keyword_packs" in changed_options
+        if reparse:
+            self.set_keyword_packs(self.api.plugin_config["keyword_packs"])
+        self.api.logger.debug("%s: Checking loaded tracks for changes to options: %s", "Format Performer Tags", sorted(changed_options),)
+        formatted = {}
+        updated = 0
+        for album, entries in list(self.track_credits.items()):
+            for track_credits in list(entries.values()):
+                if self.reformat_track_credits(album, track_credits, changed_options, reparse, previous_settings, formatted):
+                    updated += 1
+        self.api.logger.debug("%s: Updated performer tags for %s tracks", "Format Performer Tags", updated,)
+
+    def reformat_track_credits(self, album, track_credits, changed_options, reparse, previous_settings, formatted):
+        """Re-render the credits of one track depending on the changed options, and update
+        the track if its performer tags changed. Returns True if the track was updated.
+
+        `formatted` caches the results by credit, shared by all the tracks being checked.
+        """
+        settings = self.api.plugin_config
+        word_dict = self.get_word_dict(settings)
+        previous_word_dict = self.get_word_dict(previous_settings)
+        credits = []
+        previous_outputs = []
+        outputs = []
+        changed = False
+        for key, values, mainkey, instruments in track_credits.credits:
+            cache_key = (key, values)
+            if cache_key not in formatted:
+                depends = self.get_depends(instruments, previous_word_dict, previous_settings)
+                if not reparse and depends.isdisjoint(changed_options):
+                    formatted[cache_key] = None
+                else:
+                    new_instruments = self.parse_tag(key, values)[1] if reparse else instruments
+                    formatted[cache_key] = (
+                        self.render_tag(mainkey, instruments, values, previous_word_dict, previous_settings),
+                        new_instruments,
+                        self.render_tag(mainkey, new_instruments, values, word_dict, settings),
+                    )
+            result = formatted[cache_key]
+            if result is None:
+                previous_output = output = None
+            else:
+                previous_output, instruments, output = result
+                changed = changed or output != previous_output
+            credits.append((key, values, mainkey, instruments))
+            previous_outputs.append(previous_output)
+            outputs.append(output)
+        track_credits.credits = tuple(credits)
+        if not changed:
+            return False
+        track = self.find_track(album, track_credits.metadata)
+        if track is None:
+            return False
+        # Credits not depending on the changed options format the same with either settings
+        for i, (key, values, mainkey, instruments) in enumerate(credits):
+            if outputs[i] is None:
+                outputs[i] = previous_outputs[i] = self.render_tag(mainkey, instruments, values, word_dict, settings)
+        return self.update_track(track, credits, previous_outputs, outputs)
+
+    def pop_track_credits(self, track):
+        """Remove and return the cached credits applied to the track metadata, if any."""
+        for album in (track, track.album):
+            if album is None or album not in self.track_credits:
+                continue
+            entries = self.track_credits[album]
+            for node_id, track_credits in entries.items():
+                if track_credits.metadata is track.metadata:
+                    del entries[node_id]
+                    return track_credits.credits
+        return None
+
+    def restore_original_tags(self, tracks):
+        """Rebuild the original performer tags of the tracks from their cached credits."""
+        restored = 0
+        for track in tracks:
+            credits = self.pop_track_credits(track)
+            if not credits:
+                continue
+            originals = [[(key, value) for value in values] for key, values, mainkey, instruments in credits]
+            self.update_track(track, credits, self.render_credits(credits, self.api.plugin_config), originals)
+            restored += 1
+        self.api.logger.info("%s: Restored original performer tags for %s tracks", "Format Performer Tags", restored,)
+        if restored < len(tracks):
+            self.api.logger.info(
+                "%s: Unable to restore %s of %s selected tracks, not formatted in this session or already restored",
+                "Format Performer Tags", len(tracks) - restored, len(tracks),
+            )
+
+    def update_track(self, track, credits, previous_outputs, outputs):
+        """Change the performer tags of the track from the `previous_outputs` of its credits to
+        their `outputs`, leaving alone the tags changed since by a tagger script or manual edit.
+        Returns True if the track was changed."""
+        previous = self.replay_credits(credits, previous_outputs)
+        targets = [track.metadata, track.orig_metadata]
+        if track.scripted_metadata:
+            targets.append(track.scripted_metadata)
+        changed = False
+        for metadata in targets:
+            # Credits with edited tags keep them, so that a renamed key is not added back
+            target_outputs = []
+            for previous_output, output in zip(previous_outputs, outputs):
+                edited = any(metadata.getall(newkey) != previous.getall(newkey) for newkey, value in previous_output)
+                target_outputs.append(previous_output if edited else output)
+            current = self.replay_credits(credits, target_outputs)
+            for key in set(previous) | set(current):
+                values = current.getall(key)
+                previous_values = previous.getall(key)
+                if values == previous_values or metadata.getall(key) != previous_values:
+                    continue
+                if values:
+                    metadata[key] = values
+                else:
+                    metadata.delete(key)
+                changed = True
+        if not changed:
+            return False
+        for file in list(track.files):
+            track.update_file_metadata(file)
+        track.update()
+        return True
+
+
+class RestorePerformerTagsAction(BaseAction):
+
+    TITLE = t_("action.restore_performer_tags", "Restore original performer tags")
+
+    # Processor registered for tagging, holding the original credits of the loaded tracks
+    plugin = None
+
+    def callback(self, objs):
+        tracks = []
+        for obj in objs:
+            if isinstance(obj, Album):
+                tracks.extend(obj.tracks)
+            elif isinstance(obj, Track):
+                tracks.append(obj)
+        if tracks and self.plugin is not None:
+            self.plugin.restore_original_tags(tracks)
+
+
+class PerformerTagsProfiler:
+    """Profiles one in every `every_n_calls` calls of a function with cProfile and tracemalloc,
+    aggregating the results across calls until they are dumped."""
+
+    def __init__(self, api: PluginApi, every_n_calls):
+        if every_n_calls < 1:
+            raise ValueError("every_n_calls must be at least 1, got %r" % (every_n_calls,))
+        self.api = api
+        self.every_n_calls = every_n_calls
+        self.calls = 0
+        self.sampled = 0
+        self.stats = None
+        self.allocations = {}
+        self.peak_total = 0
+        self.peak_max = 0
+        self.own_lines = self.get_own_lines()
+
+    @staticmethod
+    def get_own_lines():
+        """Return the (filename, line number) of every line of the profiler code run around the
+        profiled calls, so that its own allocations are left out of the report."""
+        own_lines = set()
+        codes = [PerformerTagsProfiler.wrap.__code__, PerformerTagsProfiler.profile.__code__]
+        while codes:
+            code = codes.pop()
+            codes.extend(const for const in code.co_consts if isinstance(const, types.CodeType))
+            own_lines.update((code.co_filename, line) for _start, _end, line in code.co_lines() if line is not None)
+        return own_lines
+
+    def wrap(self, function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            self.calls += 1
+            if self.calls % self.every_n_calls:
+                return function(*args, **kwargs)
+            return self.profile(function, *args, **kwargs)
+        return wrapper
+
+    def profile(self, function, *args, **kwargs):
+        profiler = cProfile.Profile()
+        start_tracing = not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        before = self.take_snapshot()
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active (Python 3.12+)
+            if start_tracing:
+                tracemalloc.stop()
+            return function(*args, **kwargs)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profiler.disable()
+            peak = tracemalloc.get_traced_memory()[1] - current
+            after = self.take_snapshot()
+            if start_tracing:
+                tracemalloc.stop()
+            self.add_results(profiler, after.compare_to(before, 'lineno'), peak)
+
+    @staticmethod
+    def take_snapshot():
+        return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+    def add_results(self, profiler, differences, peak):
+        self.sampled += 1
+        self.peak_total += peak
+        self.peak_max = max(self.peak_max, peak)
+        if self.stats is None:
+            self.stats = pstats.Stats(profiler)
+        else:
+            self.stats.add(profiler)
+        # Only memory still allocated after the call, temporary allocations are covered by the peak
+        for difference in differences:
+            if difference.size_diff <= 0:
+                continue
+            frame = difference.traceback[0]
+            location = (frame.filename, frame.lineno)
+            if location in self.own_lines:
+                continue
+            size, count = self.allocations.get(location, (0, 0))
+            self.allocations[location] = (size + difference.size_diff, count + max(difference.count_diff, 0))
+
+    def dump(self, directory):
+        if self.stats is None:
+            self.api.logger.info("%s: No profiling samples collected yet (%s calls).", "Format Performer Tags", self.calls,)
+            return
+        os.makedirs(directory, exist_ok=True)
+        stats_file = os.path.join(directory, 'format_performer_tags.pstats')
+        self.stats.dump_stats(stats_file)
+        report_file = os.path.join(directory, 'format_performer_tags_allocations.txt')
+        top = sorted(self.allocations.items(), key=lambda item: item[1][0], reverse=True)[:PROFILE_TOP_ALLOCATIONS]
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write("Profiled %s of %s calls\n" % (self.sampled, self.calls,))
+            f.write("Peak memory during a call: mean=%.1f KiB, max=%.1f KiB\n\n" % (self.peak_total / self.sampled / 1024, self.peak_max / 1024,))
+            f.write("Top allocations still held after the calls\n\n")
+            for (filename, lineno), (size, count) in top:
+                f.write("%s:%s: size=%.1f KiB, count=%s\n" % (filename, lineno, size / 1024, count,))
+        self.api.logger.info("%s: Profile written to '%s' and '%s'", "Format Performer Tags", stats_file, report_file,)
+
+
+class DumpProfileAction(BaseAction):
+
+    TITLE = t_("action.dump_profile", "Write Format Performer Tags profile")
+
+    # Profiler wrapping the metadata processor, only set while profiling is enabled
+    profiler = None
+
+    def callback(self, objs):
+        if self.profiler is not None:
+            self.profiler.dump(get_plugin_data_dir(self.api, PROFILE_DIR))
 
 
 class FormatPerformerTagsOptionsPage(OptionsPage):
@@ -137,12 +580,24 @@ class FormatPerformerTagsOptionsPage(OptionsPage):
     TITLE = t_("ui.options_page_title", "Format Performer Tags")
     HELP_URL = USER_GUIDE_URL
 
+    # Processor registered for tagging, used to update the loaded tracks on save
+    plugin = None
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.ui = Ui_FormatPerformerTagsOptionsPage()
         self.ui.setupUi(self)
-        self._add_connections()
         self.processor = FormatPerformerTags(self.api)
+        self._add_keyword_packs()
+        self._add_connections()
+
+    def _add_keyword_packs(self):
+        for pack_id, (name, _phrases) in self.processor.keyword_packs.items():
+            item = QtWidgets.QListWidgetItem(name)
+            item.setData(QtCore.Qt.ItemDataRole.UserRole, pack_id)
+            item.setFlags(item.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(QtCore.Qt.CheckState.Unchecked)
+            self.ui.keyword_packs.addItem(item)
 
     def _add_connections(self):
         self.ui.additional_rb_1.clicked.connect(self.update_examples)
@@ -173,6 +628,7 @@ class FormatPerformerTagsOptionsPage(OptionsPage):
         self.ui.format_group_2_end_char.editingFinished.connect(self.update_examples)
         self.ui.format_group_3_end_char.editingFinished.connect(self.update_examples)
         self.ui.format_group_4_end_char.editingFinished.connect(self.update_examples)
+        self.ui.keyword_packs.itemChanged.connect(self.update_examples)
 
     def load(self):
         # Settings for Keyword: additional
@@ -219,6 +675,15 @@ class FormatPerformerTagsOptionsPage(OptionsPage):
         else:
             self.ui.vocals_rb_1.setChecked(True)
 
+        # Settings for keyword packs
+        enabled_packs = self.api.plugin_config["keyword_packs"]
+        for row in range(self.ui.keyword_packs.count()):
+            item = self.ui.keyword_packs.item(row)
+            if item.data(QtCore.Qt.ItemDataRole.UserRole) in enabled_packs:
+                item.setCheckState(QtCore.Qt.CheckState.Checked)
+            else:
+                item.setCheckState(QtCore.Qt.CheckState.Unchecked)
+
         # Settings for word group 1
         self.ui.format_group_1_start_char.setText(self.api.plugin_config["format_group_1_start_char"])
         self.ui.format_group_1_end_char.setText(self.api.plugin_config["format_group_1_end_char"])
@@ -242,7 +707,17 @@ class FormatPerformerTagsOptionsPage(OptionsPage):
         self.update_examples()
 
     def save(self):
-        self._set_settings(self.api.plugin_config)
+        settings = {}
+        self._set_settings(settings)
+        previous_settings = {}
+        changed_options = set()
+        for key, value in settings.items():
+            previous_settings[key] = self.api.plugin_config[key]
+            if previous_settings[key] != value:
+                self.api.plugin_config[key] = value
+                changed_options.add(key)
+        if changed_options and self.plugin is not None:
+            self.plugin.reformat_loaded_tracks(changed_options, previous_settings)
 
     def restore_defaults(self):
         super().restore_defaults()
@@ -274,6 +749,14 @@ class FormatPerformerTagsOptionsPage(OptionsPage):
         temp = 4 if self.ui.vocals_rb_4.isChecked() else temp
         settings["format_group_vocals"] = temp
 
+        # Settings for keyword packs
+        enabled_packs = []
+        for row in range(self.ui.keyword_packs.count()):
+            item = self.ui.keyword_packs.item(row)
+            if item.checkState() == QtCore.Qt.CheckState.Checked:
+                enabled_packs.append(item.data(QtCore.Qt.ItemDataRole.UserRole))
+        settings["keyword_packs"] = enabled_packs
+
         # Settings for word group 1
         settings["format_group_1_start_char"] = self.ui.format_group_1_start_char.text()
         settings["format_group_1_end_char"] = self.ui.format_group_1_end_char.text()
@@ -297,6 +780,7 @@ class FormatPerformerTagsOptionsPage(OptionsPage):
     def update_examples(self):
         settings = {}
         self._set_settings(settings)
+        self.processor.set_keyword_packs(settings["keyword_packs"])
         word_dict = self.processor.get_word_dict(settings)
 
         instruments_credits = {
@@ -348,14 +832,89 @@ def enable(api: PluginApi):
     api.plugin_config.register_option("format_group_4_start_char", ' (')
     api.plugin_config.register_option("format_group_4_end_char", ')')
     api.plugin_config.register_option("format_group_4_sep_char", '')
+    api.plugin_config.register_option("keyword_packs", ["en"])
+    # Hidden option, not shown on the options page
+    api.plugin_config.register_option("profile_every_n_calls", 0)
 
     # Migrate settings from 2.x version if available
     migrate_settings(api)
 
     plugin = FormatPerformerTags(api)
-
-    api.register_track_metadata_processor(plugin.format_performer_tags)
+    FormatPerformerTagsOptionsPage.plugin = plugin
+    RestorePerformerTagsAction.plugin = plugin
+
+    processor = plugin.format_performer_tags
+    every_n_calls = get_profile_every_n_calls(api)
+    if every_n_calls > 0:
+        api.logger.info("Profiling one in every %s calls of the metadata processor.", every_n_calls,)
+        DumpProfileAction.profiler = PerformerTagsProfiler(api, every_n_calls)
+        processor = DumpProfileAction.profiler.wrap(processor)
+        api.register_tools_menu_action(DumpProfileAction)
+
+    api.register_track_metadata_processor(processor)
     api.register_options_page(FormatPerformerTagsOptionsPage)
+    api.register_album_action(RestorePerformerTagsAction)
+    api.register_track_action(RestorePerformerTagsAction)
+
+
+def load_keyword_packs(api: PluginApi):
+    """Load the keyword packs shipped with the plugin, as a dict of pack id to (name, {phrase: keyword})."""
+    packs = {}
+    packs_dir = os.path.join(api.plugin_dir, KEYWORD_PACKS_DIR)
+    if os.path.isdir(packs_dir):
+        filenames = sorted(os.listdir(packs_dir))
+    else:
+        api.logger.warning("%s: Keyword packs directory not found: '%s'", "Format Performer Tags", packs_dir,)
+        filenames = []
+    for filename in filenames:
+        pack_id, ext = os.path.splitext(filename)
+        if ext != '.toml':
+            continue
+        try:
+            with open(os.path.join(packs_dir, filename), 'rb') as f:
+                data = tomllib.load(f)
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            api.logger.warning("%s: Failed to load keyword pack '%s': %s", "Format Performer Tags", filename, e,)
+            continue
+        pack_phrases = data.get('phrases', {})
+        if not isinstance(pack_phrases, dict):
+            api.logger.warning("%s: Invalid [phrases] table in keyword pack '%s'", "Format Performer Tags", filename,)
+            continue
+        phrases = {}
+        for keyword, keyword_phrases in pack_phrases.items():
+            if keyword not in WORD_LIST:
+                api.logger.warning("%s: Unknown keyword '%s' in keyword pack '%s'", "Format Performer Tags", keyword, filename,)
+                continue
+            if not isinstance(keyword_phrases, list) or not all(isinstance(phrase, str) for phrase in keyword_phrases):
+                api.logger.warning("%s: Phrases for keyword '%s' in keyword pack '%s' are not a list of strings", "Format Performer Tags", keyword, filename,)
+                continue
+            for phrase in keyword_phrases:
+                phrase = ' '.join(phrase.split())
+                if phrase:
+                    phrases[phrase] = keyword
+        packs[pack_id] = (data.get('name', pack_id), phrases)
+    if 'en' not in packs:
+        # Keep the original English keywords available without the pack file
+        api.logger.warning("%s: Using built-in English keyword pack", "Format Performer Tags",)
+        packs['en'] = ("English", {word: word for word in WORD_LIST})
+    return packs
+
+
+def get_plugin_data_dir(api: PluginApi, *paths):
+    """Return a path in the plugin's data directory, inside Picard's application data location."""
+    data_dir = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.StandardLocation.AppDataLocation)
+    return os.path.join(data_dir, 'plugin-data', api.plugin_id, *paths)
+
+
+def get_profile_every_n_calls(api: PluginApi):
+    value = os.environ.get(PROFILE_ENV_VAR)
+    if value is None:
+        return api.plugin_config["profile_every_n_calls"]
+    try:
+        return int(value)
+    except ValueError:
+        api.logger.warning("Invalid value for %s: '%s'", PROFILE_ENV_VAR, value,)
+        return 0
 
 
 def migrate_settings(api: PluginApi):
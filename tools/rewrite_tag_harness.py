@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Golden corpus equivalence and throughput harness for rewrite_tag.
+
+Runs the plugin without Picard, using a stub of the Picard Metadata class.
+
+    python tools/rewrite_tag_harness.py generate   # freeze the corpus from the current code
+    python tools/rewrite_tag_harness.py check      # compare against the corpus and time rewrite_tag
+"""
+
+
+import argparse
+import gzip
+import importlib.util
+import json
+import logging
+import os
+import random
+import sys
+import time
+import types
+
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_FILE = os.path.join(PLUGIN_DIR, 'tools', 'rewrite_tag_golden.json.gz')
+
+SEED = 20251019
+SETTINGS_COUNT = 200
+CASES_PER_SETTINGS = 100
+
+KEYWORD_PACKS = [['en'], ['en', 'de', 'es', 'fr', 'it'], []]
+START_CHARS = ['', ' ', ' (', ', ', ' [', '<']
+SEP_CHARS = ['', '', ' ', ', ', '/', ' & ']
+END_CHARS = ['', ' ', ')', ']', '>']
+
+INSTRUMENTS = [
+    'guitar', 'bass guitar', 'piano', 'drums (drum set)', 'violin', 'Gitarre', 'voce', 'alto saxophone',
+    'vocal', 'vocals', 'lead vocals', 'background vocals', 'other vocals', 'choir vocals', 'solo vocals',
+]
+KEYWORDS = [
+    'guest', 'solo', 'additional', 'special guest', 'Gast', 'invité', 'ospite speciale', 'zusätzliche',
+    'Guest', 'special',
+]
+PERFORMERS = ['Jimmy Page', 'Sandy Denny', 'Robert Plant', '', 'Johnny Flux', 'John Watson', 'Björk']
+
+
+class Metadata:
+    """Stub of picard.metadata.Metadata, limited to the behaviour used by the plugin."""
+
+    def __init__(self):
+        self._store = {}
+        self.deleted_tags = set()
+
+    @staticmethod
+    def normalize_tag(name):
+        return name.rstrip(':')
+
+    def getall(self, name):
+        return list(self._store.get(self.normalize_tag(name), []))
+
+    def rawitems(self):
+        return [(name, list(values)) for name, values in self._store.items()]
+
+    def __iter__(self):
+        return iter(self._store)
+
+    def __len__(self):
+        return len(self._store)
+
+    def __contains__(self, name):
+        return self.normalize_tag(name) in self._store
+
+    def __setitem__(self, name, values):
+        name = self.normalize_tag(name)
+        if isinstance(values, str):
+            values = [values]
+        values = [str(value) for value in values if value or value in {0, ''}]
+        if values and (len(values) > 1 or values[0]):
+            self._store[name] = values
+            self.deleted_tags.discard(name)
+        elif name in self._store:
+            self.delete(name)
+
+    def delete(self, name):
+        name = self.normalize_tag(name)
+        self._store.pop(name, None)
+        self.deleted_tags.add(name)
+
+    def add(self, name, value):
+        if value or value == 0:
+            name = self.normalize_tag(name)
+            self._store.setdefault(name, []).append(str(value))
+            self.deleted_tags.discard(name)
+
+    def add_unique(self, name, value):
+        if value not in self.getall(name):
+            self.add(name, value)
+
+
+class PluginApi:
+    def __init__(self, settings):
+        self.logger = logging.getLogger('format_performer_tags.harness')
+        self.plugin_config = settings
+        self.plugin_dir = PLUGIN_DIR
+
+
+def load_plugin():
+    """Import the plugin module, with stubs in place of the Picard API and, if missing, PyQt6."""
+    api = types.ModuleType('picard.plugin3.api')
+    api.Metadata = Metadata
+    api.PluginApi = PluginApi
+    api.t_ = lambda key, text=None, plural=None: key
+    for name in ('Album', 'BaseAction', 'OptionsPage', 'Track'):
+        setattr(api, name, type(name, (), {}))
+    sys.modules['picard'] = types.ModuleType('picard')
+    sys.modules['picard.plugin3'] = types.ModuleType('picard.plugin3')
+    sys.modules['picard.plugin3.api'] = api
+    try:
+        import PyQt6  # noqa: F401
+    except ImportError:
+        qt = sys.modules['PyQt6'] = types.ModuleType('PyQt6')
+        for name in ('QtCore', 'QtGui', 'QtWidgets'):
+            setattr(qt, name, types.ModuleType('PyQt6.' + name))
+            sys.modules['PyQt6.' + name] = getattr(qt, name)
+    spec = importlib.util.spec_from_file_location(
+        'format_performer_tags', os.path.join(PLUGIN_DIR, '__init__.py'), submodule_search_locations=[PLUGIN_DIR]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def random_settings(rng):
+    settings = {
+        "format_group_additional": rng.randint(1, 4),
+        "format_group_guest": rng.randint(1, 4),
+        "format_group_solo": rng.randint(1, 4),
+        "format_group_vocals": rng.randint(1, 4),
+        "keyword_packs": rng.choice(KEYWORD_PACKS),
+    }
+    for group_number in range(1, 5):
+        settings["format_group_{0}_start_char".format(group_number)] = rng.choice(START_CHARS)
+        settings["format_group_{0}_sep_char".format(group_number)] = rng.choice(SEP_CHARS)
+        settings["format_group_{0}_end_char".format(group_number)] = rng.choice(END_CHARS)
+    return settings
+
+
+def random_instrument(rng):
+    words = rng.choice(INSTRUMENTS).split()
+    for _i in range(rng.choice([0, 0, 1, 1, 2, 3])):
+        words.insert(rng.randint(0, len(words)), rng.choice(KEYWORDS))
+    return ' '.join(words)
+
+
+def random_credit(rng):
+    mainkey = rng.choice(['performer', 'performer', 'performer', '~performersort'])
+    shape = rng.random()
+    if shape < 0.05:
+        key = mainkey
+    elif shape < 0.1:
+        key = mainkey + ':'
+    else:
+        instruments = [random_instrument(rng) for _i in range(rng.choice([1, 1, 1, 2, 3]))]
+        if shape < 0.13:
+            # Empty instruments between separators
+            instruments.insert(rng.randint(0, len(instruments)), '')
+        subkey = instruments[0]
+        for instrument in instruments[1:]:
+            subkey += rng.choice([', ', ' and ']) + instrument
+        key = mainkey + ':' + subkey
+    values = [rng.choice(PERFORMERS) for _i in range(rng.choice([1, 1, 2, 3]))]
+    return key, values
+
+
+def run_case(processor, key, values, word_dict, settings):
+    metadata = Metadata()
+    try:
+        processor.rewrite_tag(key, values, metadata, word_dict, settings)
+    except Exception as e:
+        return {'error': type(e).__name__}
+    return {'items': metadata.rawitems(), 'deleted': sorted(metadata.deleted_tags)}
+
+
+def generate(args):
+    module = load_plugin()
+    rng = random.Random(SEED)
+    corpus = {'settings': [], 'cases': []}
+    for settings_index in range(SETTINGS_COUNT):
+        settings = random_settings(rng)
+        corpus['settings'].append(settings)
+        processor = module.FormatPerformerTags(PluginApi(settings))
+        word_dict = processor.get_word_dict(settings)
+        for _i in range(CASES_PER_SETTINGS):
+            key, values = random_credit(rng)
+            corpus['cases'].append([settings_index, key, values, run_case(processor, key, values, word_dict, settings)])
+    with gzip.open(args.corpus, 'wt', encoding='utf-8') as f:
+        json.dump(corpus, f, ensure_ascii=False, separators=(',', ':'))
+    print("Wrote %s cases to %s" % (len(corpus['cases']), args.corpus,))
+
+
+def check(args):
+    module = load_plugin()
+    with gzip.open(args.corpus, 'rt', encoding='utf-8') as f:
+        corpus = json.load(f)
+    cases_by_settings = {}
+    for case in corpus['cases']:
+        cases_by_settings.setdefault(case[0], []).append(case[1:])
+
+    # Equivalence, comparing through a JSON round trip as stored in the corpus
+    mismatches = 0
+    for settings_index, cases in cases_by_settings.items():
+        settings = corpus['settings'][settings_index]
+        processor = module.FormatPerformerTags(PluginApi(settings))
+        word_dict = processor.get_word_dict(settings)
+        for key, values, expected in cases:
+            result = json.loads(json.dumps(run_case(processor, key, values, word_dict, settings)))
+            if result != expected:
+                mismatches += 1
+                if mismatches <= args.show:
+                    print("Mismatch for %r %r with settings #%s:\n  expected: %r\n  got:      %r" % (key, values, settings_index, expected, result,))
+
+    # Throughput, timing only the rewrite_tag calls
+    elapsed = 0.0
+    calls = 0
+    for _i in range(args.repeat):
+        for settings_index, cases in cases_by_settings.items():
+            settings = corpus['settings'][settings_index]
+            processor = module.FormatPerformerTags(PluginApi(settings))
+            word_dict = processor.get_word_dict(settings)
+            rewrite_tag = processor.rewrite_tag
+            for key, values, expected in cases:
+                metadata = Metadata()
+                start = time.perf_counter()
+                try:
+                    rewrite_tag(key, values, metadata, word_dict, settings)
+                except Exception:
+                    pass
+                elapsed += time.perf_counter() - start
+                calls += 1
+
+    print("Equivalence: %s of %s cases differ" % (mismatches, len(corpus['cases']),))
+    print("Throughput: %s calls in %.3f s (%.0f calls/s)" % (calls, elapsed, calls / elapsed if elapsed else 0,))
+    return 1 if mismatches else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Golden corpus equivalence and throughput harness for rewrite_tag.")
+    parser.add_argument('--corpus', default=CORPUS_FILE, help="corpus file (default: %(default)s)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('generate', help="generate the golden corpus from the current implementation")
+    check_parser = subparsers.add_parser('check', help="check equivalence with the golden corpus and measure throughput")
+    check_parser.add_argument('--repeat', type=int, default=3, help="number of timed passes over the corpus (default: %(default)s)")
+    check_parser.add_argument('--show', type=int, default=10, help="maximum number of mismatches to print (default: %(default)s)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    if args.command == 'generate':
+        generate(args)
+        return 0
+    return check(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2025 Bob Swift (rdswift)
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.
+
+"""Checks of the session cache used to reformat and restore the loaded tracks.
+
+Runs the plugin without Picard, using the stubs of the golden corpus harness.
+
+    python tools/session_cache_check.py
+"""
+
+
+import sys
+import unittest
+
+from rewrite_tag_harness import (
+    Metadata,
+    PluginApi,
+    load_plugin,
+)
+
+
+plugin = load_plugin()
+
+DEFAULT_SETTINGS = {
+    "format_group_additional": 3,
+    "format_group_guest": 4,
+    "format_group_solo": 3,
+    "format_group_vocals": 2,
+    "format_group_1_start_char": '',
+    "format_group_1_end_char": ' ',
+    "format_group_1_sep_char": '',
+    "format_group_2_start_char": ', ',
+    "format_group_2_end_char": '',
+    "format_group_2_sep_char": '',
+    "format_group_3_start_char": ' (',
+    "format_group_3_end_char": ')',
+    "format_group_3_sep_char": '',
+    "format_group_4_start_char": ' (',
+    "format_group_4_end_char": ')',
+    "format_group_4_sep_char": '',
+    "keyword_packs": ["en"],
+}
+
+
+def copy_metadata(metadata):
+    copy = Metadata()
+    for key, values in metadata.rawitems():
+        copy[key] = values
+    return copy
+
+
+class Album(plugin.Album):
+    def __init__(self):
+        self.tracks = []
+
+
+class Track(plugin.Track):
+    """Loaded track, keeping its metadata the way Picard does after running the processors and scripts."""
+
+    def __init__(self, album, metadata):
+        self.album = album
+        self.metadata = metadata
+        self.orig_metadata = copy_metadata(metadata)
+        self.scripted_metadata = copy_metadata(metadata)
+        self.files = []
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+
+
+class SessionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.settings = dict(DEFAULT_SETTINGS)
+        self.processor = plugin.FormatPerformerTags(PluginApi(self.settings))
+        self.album = Album()
+        self.node_count = 0
+
+    def load_track(self, credits):
+        """Run the processor on the track credits and add the track to the album."""
+        metadata = Metadata()
+        for key, values in credits.items():
+            metadata[key] = values
+        track = Track(self.album, metadata)
+        self.node_count += 1
+        self.processor.format_performer_tags(None, self.album, metadata, {'id': str(self.node_count)}, {})
+        track.orig_metadata = copy_metadata(metadata)
+        track.scripted_metadata = copy_metadata(metadata)
+        self.album.tracks.append(track)
+        return track
+
+    def save(self, **options):
+        """Change the options as the options page does on save."""
+        previous_settings = dict(self.settings)
+        self.settings.update(options)
+        changed_options = {key for key in options if previous_settings[key] != options[key]}
+        self.processor.reformat_loaded_tracks(changed_options, previous_settings)
+
+    def assert_performers(self, track, expected):
+        for metadata in (track.metadata, track.orig_metadata, track.scripted_metadata):
+            performers = {key: values for key, values in metadata.rawitems() if key.startswith('performer')}
+            self.assertEqual(performers, expected)
+
+    def test_depends_from_parse(self):
+        word_dict = self.processor.get_word_dict(self.settings)
+        mainkey, instruments = self.processor.parse_tag('performer:guest lead vocals', ['A'])
+        self.assertEqual(
+            self.processor.get_depends(instruments, word_dict, self.settings),
+            {
+                'format_group_guest', 'format_group_vocals',
+                'format_group_2_start_char', 'format_group_2_sep_char', 'format_group_2_end_char',
+                'format_group_4_start_char', 'format_group_4_sep_char', 'format_group_4_end_char',
+            },
+        )
+        mainkey, instruments = self.processor.parse_tag('performer:guitar', ['A'])
+        self.assertEqual(self.processor.get_depends(instruments, word_dict, self.settings), set())
+
+    def test_reformat_affected_tracks_only(self):
+        guest = self.load_track({'performer:guest guitar': ['A']})
+        plain = self.load_track({'performer:piano': ['B']})
+        self.assert_performers(guest, {'performer:guitar': ['A (guest)']})
+        self.save(format_group_4_start_char=' [', format_group_4_end_char=']', format_group_3_start_char=' {')
+        self.assert_performers(guest, {'performer:guitar': ['A [guest]']})
+        self.assert_performers(plain, {'performer:piano': ['B']})
+        self.assertEqual((guest.updates, plain.updates), (1, 0))
+
+    def test_reformat_after_group_change(self):
+        track = self.load_track({'performer:guest guitar': ['A']})
+        self.save(format_group_guest=3)
+        self.assert_performers(track, {'performer:guitar (guest)': ['A']})
+        self.save(format_group_3_start_char=' [', format_group_3_end_char=']')
+        self.assert_performers(track, {'performer:guitar [guest]': ['A']})
+        self.save(format_group_4_start_char=' <')
+        self.assertEqual(track.updates, 2)
+
+    def test_reformat_keyword_packs(self):
+        track = self.load_track({'performer:Gast Gitarre': ['A']})
+        self.assert_performers(track, {'performer:Gast Gitarre': ['A']})
+        self.save(keyword_packs=['en', 'de'])
+        self.assert_performers(track, {'performer:Gitarre': ['A (Gast)']})
+
+    def test_tracks_sharing_keys(self):
+        first = self.load_track({'performer:guest piano': ['A'], 'performer:additional piano': ['B']})
+        second = self.load_track({'performer:guest piano': ['A']})
+        self.save(format_group_additional=4)
+        self.assert_performers(first, {'performer:piano': ['A (guest)', 'B (additional)']})
+        self.save(format_group_4_start_char=' [', format_group_4_end_char=']')
+        self.assert_performers(first, {'performer:piano': ['A [guest]', 'B [additional]']})
+        self.assert_performers(second, {'performer:piano': ['A [guest]']})
+
+    def test_find_track(self):
+        track = self.load_track({'performer:guest guitar': ['A']})
+        self.assertIs(self.processor.find_track(self.album, track.metadata), track)
+        self.assertIs(self.processor.find_track(track, track.metadata), track)
+        self.assertIsNone(self.processor.find_track(self.album, Metadata()))
+
+    def test_track_owner(self):
+        # Picard 3 passes the track to the processor instead of the album
+        track = Track(self.album, Metadata())
+        track.metadata['performer:guest guitar'] = ['A']
+        self.processor.format_performer_tags(None, track, track.metadata, {'id': 'node'}, {})
+        track.orig_metadata = copy_metadata(track.metadata)
+        track.scripted_metadata = copy_metadata(track.metadata)
+        self.save(format_group_4_start_char=' [', format_group_4_end_char=']')
+        self.assert_performers(track, {'performer:guitar': ['A [guest]']})
+        self.processor.restore_original_tags([track])
+        self.assert_performers(track, {'performer:guest guitar': ['A']})
+
+    def test_restore(self):
+        track = self.load_track({'performer:guest guitar': ['A'], 'performer:vocals': ['B'], 'performer:': ['C']})
+        self.save(format_group_4_start_char=' [', format_group_4_end_char=']')
+        self.processor.restore_original_tags([track])
+        self.assert_performers(track, {'performer:guest guitar': ['A'], 'performer:vocals': ['B'], 'performer': ['C']})
+        self.assertFalse(self.processor.track_credits[self.album])
+        with self.assertLogs(self.processor.api.logger, level='INFO') as logs:
+            self.processor.restore_original_tags([track])
+        self.assertIn("Unable to restore 1 of 1 selected tracks", logs.output[-1])
+        self.assertEqual(track.updates, 2)
+
+    def test_edits_kept(self):
+        track = self.load_track({'performer:guest guitar': ['A'], 'performer:solo piano': ['B']})
+        # Tags removed by a tagger script, and changed by a manual edit
+        track.metadata.delete('performer:guitar')
+        track.scripted_metadata.delete('performer:guitar')
+        track.metadata['performer:piano (solo)'] = ['C']
+        self.save(format_group_4_start_char=' [', format_group_4_end_char=']', format_group_3_start_char=' [', format_group_3_end_char=']')
+        self.assertNotIn('performer:guitar', track.metadata)
+        self.assertEqual(track.orig_metadata.getall('performer:guitar'), ['A [guest]'])
+        self.assertNotIn('performer:guitar [guest]', track.metadata)
+        self.assertEqual(track.metadata.getall('performer:piano (solo)'), ['C'])
+        self.assertNotIn('performer:piano [solo]', track.metadata)
+        self.processor.restore_original_tags([track])
+        self.assertNotIn('performer:guest guitar', track.metadata)
+        self.assertEqual(track.metadata.getall('performer:piano (solo)'), ['C'])
+
+    def test_no_album_or_track_node(self):
+        metadata = Metadata()
+        metadata['performer:guest guitar'] = ['A']
+        self.processor.format_performer_tags(None, None, metadata, {'id': 'node'}, {})
+        self.assertEqual(metadata.getall('performer:guitar'), ['A (guest)'])
+        metadata = Metadata()
+        metadata['performer:guest guitar'] = ['A']
+        self.processor.format_performer_tags(None, self.album, metadata)
+        self.assertEqual(metadata.getall('performer:guitar'), ['A (guest)'])
+        self.assertEqual(len(self.processor.track_credits), 0)
+
+
+if __name__ == '__main__':
+    sys.exit(unittest.main())
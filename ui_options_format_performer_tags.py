@@ -157,6 +157,27 @@ class Ui_FormatPerformerTagsOptionsPage(object):
         self.verticalLayout_2.addWidget(self.section_keyword_frame)
         spacerItem1 = QtWidgets.QSpacerItem(20, 6, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
         self.verticalLayout_2.addItem(spacerItem1)
+        self.section_keyword_packs_title = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.section_keyword_packs_title.setFont(font)
+        self.section_keyword_packs_title.setObjectName("section_keyword_packs_title")
+        self.verticalLayout_2.addWidget(self.section_keyword_packs_title)
+        self.section_keyword_packs_frame = QtWidgets.QFrame(parent=self.scrollAreaWidgetContents)
+        self.section_keyword_packs_frame.setObjectName("section_keyword_packs_frame")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.section_keyword_packs_frame)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.keyword_packs_description = QtWidgets.QLabel(parent=self.section_keyword_packs_frame)
+        self.keyword_packs_description.setWordWrap(True)
+        self.keyword_packs_description.setObjectName("keyword_packs_description")
+        self.verticalLayout_3.addWidget(self.keyword_packs_description)
+        self.keyword_packs = QtWidgets.QListWidget(parent=self.section_keyword_packs_frame)
+        self.keyword_packs.setMaximumSize(QtCore.QSize(16777215, 100))
+        self.keyword_packs.setObjectName("keyword_packs")
+        self.verticalLayout_3.addWidget(self.keyword_packs)
+        self.verticalLayout_2.addWidget(self.section_keyword_packs_frame)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 6, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+        self.verticalLayout_2.addItem(spacerItem2)
         self.section_display_title = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
         font = QtGui.QFont()
         font.setBold(True)
@@ -293,12 +314,12 @@ class Ui_FormatPerformerTagsOptionsPage(object):
         self.format_group_4_sep_char.setText("")
         self.format_group_4_sep_char.setObjectName("format_group_4_sep_char")
         self.gridLayout.addWidget(self.format_group_4_sep_char, 4, 2, 1, 1, QtCore.Qt.AlignmentFlag.AlignHCenter)
-        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
-        self.gridLayout.addItem(spacerItem2, 0, 4, 1, 1)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.gridLayout.addItem(spacerItem3, 0, 4, 1, 1)
         self.verticalLayout_6.addLayout(self.gridLayout)
         self.verticalLayout_2.addWidget(self.section_display_frame)
-        spacerItem3 = QtWidgets.QSpacerItem(20, 6, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
-        self.verticalLayout_2.addItem(spacerItem3)
+        spacerItem4 = QtWidgets.QSpacerItem(20, 6, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+        self.verticalLayout_2.addItem(spacerItem4)
         self.section_example_title = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
         font = QtGui.QFont()
         font.setBold(True)
@@ -318,8 +339,8 @@ class Ui_FormatPerformerTagsOptionsPage(object):
         self.example_vocals.setObjectName("example_vocals")
         self.verticalLayout_4.addWidget(self.example_vocals)
         self.verticalLayout_2.addWidget(self.section_examples_frame)
-        spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_2.addItem(spacerItem4)
+        spacerItem5 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem5)
         self.scrollArea.setWidget(self.scrollAreaWidgetContents)
         self.verticalLayout.addWidget(self.scrollArea)
 
@@ -336,6 +357,8 @@ class Ui_FormatPerformerTagsOptionsPage(object):
         self.group_guest.setTitle(_translate("FormatPerformerTagsOptionsPage", "section.keyword.guest.title"))
         self.group_solo.setTitle(_translate("FormatPerformerTagsOptionsPage", "section.keyword.solo.title"))
         self.group_vocals.setTitle(_translate("FormatPerformerTagsOptionsPage", "section.keyword.vocals.title"))
+        self.section_keyword_packs_title.setText(_translate("FormatPerformerTagsOptionsPage", "section.keyword_packs.title"))
+        self.keyword_packs_description.setText(_translate("FormatPerformerTagsOptionsPage", "section.keyword_packs.text"))
         self.section_display_title.setText(_translate("FormatPerformerTagsOptionsPage", "section.display.title"))
         self.format_group_3_start_char.setPlaceholderText(_translate("FormatPerformerTagsOptionsPage", "placeholder.blank"))
         self.format_group_3_sep_char.setPlaceholderText(_translate("FormatPerformerTagsOptionsPage", "placeholder.blank"))